@@ -1,8 +1,13 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
+import sys
 import uuid
+from types import MappingProxyType
+from bisect import bisect_left, insort
 
 from langgraph.graph import StateGraph, END
 from langgraph.store.memory import InMemoryStore
@@ -15,6 +20,21 @@ from IPython.display import Image, display
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+# One timestamp per engine tick (start/resume), shared by nodes, meta and events
+_tick_ts: ContextVar[Optional[str]] = ContextVar("_tick_ts", default=None)
+
+def tick_iso() -> str:
+    return _tick_ts.get() or now_iso()
+
+@contextmanager
+def _tick() -> Iterator[str]:
+    ts = now_iso()
+    token = _tick_ts.set(ts)
+    try:
+        yield ts
+    finally:
+        _tick_ts.reset(token)
+
 # ==========
 # Audit metadata model
 # ==========
@@ -29,15 +49,184 @@ class InstanceMeta:
     last_node: Optional[str] = None
     start_time: Optional[str] = None
     end_time: Optional[str] = None
-    steps_history: List[Dict[str, Any]] = field(default_factory=list)  # [{ts, node, actor, status}]
+    # Step history is derived from the event log (see Engine.steps_history);
+    # meta only keeps a counter and the time of the latest step
+    last_step_seq: int = 0
+    last_step_ts: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Shallow on purpose: every field is a scalar, so no recursive copy is needed
+        return {k: getattr(self, k) for k in _META_FIELDS}
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "InstanceMeta":
         return InstanceMeta(**d)
 
+_META_FIELDS = tuple(f.name for f in fields(InstanceMeta))
+
+class Event:
+    """One audit log record; slotted to keep per-event allocation small."""
+    __slots__ = ("ts", "instance_id", "event", "node", "status", "actor", "data")
+
+    def __init__(
+        self,
+        ts: str,
+        instance_id: str,
+        event: str,
+        node: Optional[str],
+        status: str,
+        actor: Optional[str],
+        data: Dict[str, Any],
+    ):
+        self.ts = ts
+        self.instance_id = instance_id
+        self.event = event
+        self.node = node
+        self.status = status
+        self.actor = actor
+        self.data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in Event.__slots__}
+
+class InstanceMetaView:
+    """Read-only attribute view over a stored meta dict; built by list_instances without copying."""
+    __slots__ = ("_d",)
+
+    def __init__(self, d: Dict[str, Any]):
+        self._d = d
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names other than the slot; an unset _d (copy/pickle reconstruction)
+        # must not look itself up again
+        if name == "_d":
+            raise AttributeError(name)
+        try:
+            return self._d[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, InstanceMetaView):
+            return self._d == other._d
+        if isinstance(other, InstanceMeta):
+            return self._d == other.to_dict()
+        return NotImplemented
+
+    __hash__ = None  # compares by value like the InstanceMeta dataclass, so unhashable too
+
+    def __repr__(self) -> str:
+        return f"InstanceMetaView({self._d!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._d)  # shallow: meta fields are scalars
+
+    def as_mapping(self) -> "MappingProxyType[str, Any]":
+        # Zero-copy read-only mapping over the stored dict
+        return MappingProxyType(self._d)
+
+    def to_meta(self) -> InstanceMeta:
+        return InstanceMeta.from_dict(dict(self._d))
+
+# ==========
+# Node names and decision vocabulary (interned for identity-fast compares)
+# ==========
+_VALIDATE_REQUEST = sys.intern("Validate Request")
+_GATHER_CLAIM_INFO = sys.intern("Gather Claim Info")
+_IDENTIFY_ACCOUNTS = sys.intern("Identify Accounts & Process Decision")
+_CANCEL_REQUEST = sys.intern("Cancel CWD Request")
+_HOLD_REQUEST = sys.intern("Hold Request")
+_APPLY_SUPPRESSION = sys.intern("Apply Temporary Suppression")
+_FULFILL_CASE = sys.intern("Fulfill Case and Detect")
+
+_YES, _NO = sys.intern("yes"), sys.intern("no")
+_CANCEL, _HOLD, _SUPPRESS = sys.intern("cancel"), sys.intern("hold"), sys.intern("suppress")
+_RESUME, _ABORT = sys.intern("resume"), sys.intern("abort")
+
+_TERMINAL_STATUSES = frozenset(("completed", "aborted"))
+
+# Events that close a tick; their node is where the run stopped
+_STEP_EVENTS = frozenset(("paused", "progressed", "completed", "aborted"))
+
+def _intern_input(v: Any) -> Any:
+    # HITL values arrive as fresh strings (e.g. from json.loads); intern short ones
+    # so routing compares against the constants above hit the identity fast path
+    if isinstance(v, str) and len(v) < 16:
+        return sys.intern(v)
+    return v
+
+# Decision routing: node -> (bag key, {decision value: next node}); nodes only pass valid choices
+_ROUTES: Dict[str, Tuple[str, Dict[str, str]]] = {
+    _VALIDATE_REQUEST: ("validate", {_YES: _GATHER_CLAIM_INFO, _NO: _CANCEL_REQUEST}),
+    _IDENTIFY_ACCOUNTS: ("process_decision", {
+        _CANCEL: _CANCEL_REQUEST, _HOLD: _HOLD_REQUEST, _SUPPRESS: _APPLY_SUPPRESSION,
+    }),
+    _HOLD_REQUEST: ("hold_action", {_RESUME: _APPLY_SUPPRESSION, _ABORT: _CANCEL_REQUEST}),
+    _APPLY_SUPPRESSION: ("proceed_fulfill", {_YES: _FULFILL_CASE, _NO: _CANCEL_REQUEST}),
+}
+
+# Bag keys whose values are decisions routed through _ROUTES
+_DECISION_KEYS = frozenset(key for key, _ in _ROUTES.values())
+
+# Known decision values in their common casings, so norm() is one dict hit for typical input
+_NORM_FAST: Dict[str, str] = {
+    variant: value
+    for value in (_YES, _NO, _CANCEL, _HOLD, _SUPPRESS, _RESUME, _ABORT)
+    for variant in (value, value.upper(), value.capitalize())
+}
+
+def norm(v: Any) -> Any:
+    if not isinstance(v, str):
+        return v
+    fast = _NORM_FAST.get(v)
+    if fast is not None:
+        return fast
+    return _intern_input(v.strip().casefold())
+
+def _is_choice(v: Any, allowed: frozenset) -> bool:
+    # isinstance first: an unhashable JSON value (list/dict) must not reach the set lookup
+    return isinstance(v, str) and v in allowed
+
+# HITL nodes: node -> prompt shown until the node's input is present / a valid choice
+_HITL_PROMPTS: Dict[str, str] = {
+    _VALIDATE_REQUEST: "Validate request? (yes/no)",
+    _GATHER_CLAIM_INFO: "Provide claim details",
+    _IDENTIFY_ACCOUNTS: "Decision? cancel / hold / suppress",
+    _HOLD_REQUEST: "Workflow on hold. Command: resume / abort",
+    _APPLY_SUPPRESSION: "Proceed to fulfill? (yes/no)",
+}
+
+# HITL node -> (bag key, accepted values or None for free text). Decision keys and their
+# accepted values come from _ROUTES, so validation can never disagree with routing.
+_HITL_INPUTS: Dict[str, Tuple[str, Optional[frozenset]]] = {
+    node: (key, frozenset(table)) for node, (key, table) in _ROUTES.items()
+}
+_HITL_INPUTS[_GATHER_CLAIM_INFO] = ("claim_details", None)
+
+def _pause_pattern(bag: Dict[str, Any]) -> Tuple[Any, ...]:
+    # Everything the claim graph reads from the bag, reduced to what decides where it pauses.
+    # Built from _HITL_INPUTS, the same table the HITL nodes validate against.
+    pattern: List[Any] = []
+    for key, allowed in _HITL_INPUTS.values():
+        v = bag.get(key)
+        if allowed is None:
+            # free text: the node checks presence, the router checks truthiness
+            pattern.append((key in bag, bool(v)))
+        else:
+            pattern.append(v if _is_choice(v, allowed) else None)
+    return tuple(pattern)
+
+def _table_router(node: str):
+    key, table = _ROUTES[node]
+    lookup = table.get
+
+    def route(s):
+        if isinstance(s, Interrupt):
+            return END
+        return lookup(s["bag"].get(key), END)
+
+    return route
+
 # ==========
 # Workflow definition with Interrupt guards
 # ==========
@@ -46,120 +235,78 @@ def build_claim_workflow():
         s.setdefault("bag", {})
         s.setdefault("meta", {})
         s["meta"].setdefault("status", "in_progress")
-        s["meta"].setdefault("start_time", now_iso())
-
-    def validate_request(s: Dict[str, Any]):
-        ensure_defaults(s)
-        s["meta"]["last_node"] = "Validate Request"
-        if "validate" not in s["bag"]:
-            return Interrupt("Validate request? (yes/no)")
-        return s
-
-    def gather_claim_info(s: Dict[str, Any]):
-        ensure_defaults(s)
-        s["meta"]["last_node"] = "Gather Claim Info"
-        if "claim_details" not in s["bag"]:
-            return Interrupt("Provide claim details")
-        return s
-
-    def identify_accounts(s: Dict[str, Any]):
-        ensure_defaults(s)
-        s["meta"]["last_node"] = "Identify Accounts & Process Decision"
-        if "process_decision" not in s["bag"]:
-            return Interrupt("Decision? cancel / hold / suppress")
-        return s
+        s["meta"].setdefault("start_time", tick_iso())
+
+    def hitl_node(node: str):
+        # One HITL node: pause with its prompt until its input is present (free text) or a
+        # valid choice. key/allowed/prompt are bound once here, not looked up per call.
+        key, allowed = _HITL_INPUTS[node]
+        prompt = _HITL_PROMPTS[node]
+
+        if allowed is None:
+            def step(s: Dict[str, Any]):
+                ensure_defaults(s)
+                s["meta"]["last_node"] = node
+                if key not in s["bag"]:
+                    return Interrupt(prompt)
+                return s
+        else:
+            def step(s: Dict[str, Any]):
+                ensure_defaults(s)
+                s["meta"]["last_node"] = node
+                if not _is_choice(s["bag"].get(key), allowed):
+                    return Interrupt(prompt)
+                return s
+
+        return step
 
     def cancel_request(s: Dict[str, Any]):
         ensure_defaults(s)
-        s["meta"]["last_node"] = "Cancel CWD Request"
+        s["meta"]["last_node"] = _CANCEL_REQUEST
         s["meta"]["status"] = "aborted"
-        s["meta"]["end_time"] = now_iso()
+        s["meta"]["end_time"] = tick_iso()
         s["bag"]["result"] = "Workflow aborted."
         return s
 
-    def hold_request(s: Dict[str, Any]):
-        ensure_defaults(s)
-        s["meta"]["last_node"] = "Hold Request"
-        if "hold_action" not in s["bag"]:
-            return Interrupt("Workflow on hold. Command: resume / abort")
-        return s
-
-    def apply_suppression(s: Dict[str, Any]):
-        ensure_defaults(s)
-        s["meta"]["last_node"] = "Apply Temporary Suppression"
-        if "proceed_fulfill" not in s["bag"]:
-            return Interrupt("Proceed to fulfill? (yes/no)")
-        return s
-
     def fulfill_case(s: Dict[str, Any]):
         ensure_defaults(s)
-        s["meta"]["last_node"] = "Fulfill Case and Detect"
+        s["meta"]["last_node"] = _FULFILL_CASE
         s["meta"]["status"] = "completed"
-        s["meta"]["end_time"] = now_iso()
+        s["meta"]["end_time"] = tick_iso()
         s["bag"]["result"] = "Fulfilled and detection complete."
         return s
 
     g = StateGraph(dict)
-    g.add_node("Validate Request", validate_request)
-    g.add_node("Gather Claim Info", gather_claim_info)
-    g.add_node("Identify Accounts & Process Decision", identify_accounts)
-    g.add_node("Cancel CWD Request", cancel_request)
-    g.add_node("Hold Request", hold_request)
-    g.add_node("Apply Temporary Suppression", apply_suppression)
-    g.add_node("Fulfill Case and Detect", fulfill_case)
+    g.add_node(_VALIDATE_REQUEST, hitl_node(_VALIDATE_REQUEST))
+    g.add_node(_GATHER_CLAIM_INFO, hitl_node(_GATHER_CLAIM_INFO))
+    g.add_node(_IDENTIFY_ACCOUNTS, hitl_node(_IDENTIFY_ACCOUNTS))
+    g.add_node(_CANCEL_REQUEST, cancel_request)
+    g.add_node(_HOLD_REQUEST, hitl_node(_HOLD_REQUEST))
+    g.add_node(_APPLY_SUPPRESSION, hitl_node(_APPLY_SUPPRESSION))
+    g.add_node(_FULFILL_CASE, fulfill_case)
 
-    g.set_entry_point("Validate Request")
+    g.set_entry_point(_VALIDATE_REQUEST)
 
     # Conditional edges with Interrupt guards (return END when paused)
+    for node, (_, table) in _ROUTES.items():
+        path_map = {target: target for target in table.values()}
+        path_map[END] = END
+        g.add_conditional_edges(node, _table_router(node), path_map)
     g.add_conditional_edges(
-        "Validate Request",
+        _GATHER_CLAIM_INFO,
         lambda s: END if isinstance(s, Interrupt) else (
-            "Gather Claim Info" if s["bag"].get("validate") == "yes"
-            else "Cancel CWD Request" if s["bag"].get("validate") == "no"
-            else END
+            _IDENTIFY_ACCOUNTS if s["bag"].get("claim_details") else END
         ),
-        {"Gather Claim Info": "Gather Claim Info", "Cancel CWD Request": "Cancel CWD Request", END: END},
+        {_IDENTIFY_ACCOUNTS: _IDENTIFY_ACCOUNTS, END: END},
     )
-    g.add_conditional_edges(
-        "Gather Claim Info",
-        lambda s: END if isinstance(s, Interrupt) else (
-            "Identify Accounts & Process Decision" if s["bag"].get("claim_details") else END
-        ),
-        {"Identify Accounts & Process Decision": "Identify Accounts & Process Decision", END: END},
-    )
-    g.add_conditional_edges(
-        "Identify Accounts & Process Decision",
-        lambda s: END if isinstance(s, Interrupt) else (
-            "Cancel CWD Request" if s["bag"].get("process_decision") == "cancel"
-            else "Hold Request" if s["bag"].get("process_decision") == "hold"
-            else "Apply Temporary Suppression" if s["bag"].get("process_decision") == "suppress"
-            else END
-        ),
-        {"Cancel CWD Request": "Cancel CWD Request", "Hold Request": "Hold Request", "Apply Temporary Suppression": "Apply Temporary Suppression", END: END},
-    )
-    g.add_conditional_edges(
-        "Hold Request",
-        lambda s: END if isinstance(s, Interrupt) else (
-            "Apply Temporary Suppression" if s["bag"].get("hold_action") == "resume"
-            else "Cancel CWD Request" if s["bag"].get("hold_action") == "abort"
-            else END
-        ),
-        {"Apply Temporary Suppression": "Apply Temporary Suppression", "Cancel CWD Request": "Cancel CWD Request", END: END},
-    )
-    g.add_conditional_edges(
-        "Apply Temporary Suppression",
-        lambda s: END if isinstance(s, Interrupt) else (
-            "Fulfill Case and Detect" if s["bag"].get("proceed_fulfill") == "yes"
-            else "Cancel CWD Request" if s["bag"].get("proceed_fulfill") == "no"
-            else END
-        ),
-        {"Fulfill Case and Detect": "Fulfill Case and Detect", "Cancel CWD Request": "Cancel CWD Request", END: END},
-    )
-    g.add_edge("Fulfill Case and Detect", END)
-    g.add_edge("Cancel CWD Request", END)
+    g.add_edge(_FULFILL_CASE, END)
+    g.add_edge(_CANCEL_REQUEST, END)
 
     return g.compile()
 
+# The claim workflow is static, so compile it once and share it across Engines
+_COMPILED_CLAIM_GRAPH = build_claim_workflow()
+
 # ==========
 # Engine for LangGraph 0.6.6
 # ==========
@@ -168,11 +315,25 @@ class Engine:
     META_NS = "workflow_meta"
     EVENTS_NS = "workflow_events"
     INDEX_NS = "workflow_index"
+    # Secondary indexes over meta: store key -> columns. Each maps the column value
+    # (or value tuple for composite indexes) to the set of matching instance ids.
+    INDEXES: Dict[str, Tuple[str, ...]] = {
+        "by_workflow_name": ("workflow_name",),
+        "by_status": ("status",),
+        "by_customer_id": ("customer_id",),
+        "by_started_by": ("started_by",),
+        "by_workflow_status": ("workflow_name", "status"),
+    }
 
     def __init__(self, store: InMemoryStore, workflow_name: str = "ClaimWorkflow"):
         self.store = store
         self.workflow_name = workflow_name
-        self.graph = build_claim_workflow()
+        self.graph = _COMPILED_CLAIM_GRAPH
+        # Events recorded during the current tick, written with one extend in _flush_events
+        self._pending_events: List[Event] = []
+        # Bag pattern -> (last_node, prompt) for runs that paused; only pauses are cached
+        # because completing/aborting runs have side effects (end_time, result)
+        self._pause_templates: Dict[Tuple[Any, ...], Tuple[str, Any]] = {}
         #grap = self.graph
         #display(Image(grap.get_graph().draw_mermaid_png()))
 
@@ -180,14 +341,56 @@ class Engine:
     def _unwrap(self, item):
         return item.value if item else None
 
-    # Index helpers
-    def _add_to_index(self, instance_id: str) -> None:
-        idx = self._unwrap(self.store.get(self.INDEX_NS, "instances")) or []
-        if instance_id not in idx:
-            idx.append(instance_id)
-            self.store.put(self.INDEX_NS, "instances", idx)
+    # Index helpers (every instance is tracked by the "updated_keys"/"by_updated" order index)
+    def _get_index(self, name: str) -> Dict[Any, set]:
+        return self._unwrap(self.store.get(self.INDEX_NS, name)) or {}
 
-    # Event log
+    @staticmethod
+    def _index_key(m: Dict[str, Any], columns: Tuple[str, ...]) -> Any:
+        if len(columns) == 1:
+            return m.get(columns[0])
+        return tuple(m.get(c) for c in columns)
+
+    def _reindex_meta(self, old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> None:
+        # Patch only the indexes whose key changed between old and new meta
+        instance_id = new["instance_id"]
+        for name, columns in self.INDEXES.items():
+            new_key = self._index_key(new, columns)
+            if old is not None:
+                old_key = self._index_key(old, columns)
+                if old_key == new_key:
+                    continue
+            idx = self._get_index(name)
+            if old is not None:
+                ids = idx.get(old_key)
+                if ids:
+                    ids.discard(instance_id)
+                    if not ids:
+                        del idx[old_key]
+            idx.setdefault(new_key, set()).add(instance_id)
+            self.store.put(self.INDEX_NS, name, idx)
+
+    def _reorder_meta(self, m: Dict[str, Any]) -> None:
+        # Keep instances sorted by last step time at write time so listing never sorts.
+        # Entries are (ts, -seq, instance_id): ties keep creation order when read newest-first.
+        keys = self._unwrap(self.store.get(self.INDEX_NS, "updated_keys")) or {}
+        instance_id = m["instance_id"]
+        ts = m["last_step_ts"] or ""
+        old = keys.get(instance_id)
+        if old is not None and old[0] == ts:
+            return
+        order = self._unwrap(self.store.get(self.INDEX_NS, "by_updated")) or []
+        if old is not None:
+            del order[bisect_left(order, old)]
+            seq = -old[1]
+        else:
+            seq = len(keys)
+        keys[instance_id] = entry = (ts, -seq, instance_id)
+        insort(order, entry)
+        self.store.put(self.INDEX_NS, "by_updated", order)
+        self.store.put(self.INDEX_NS, "updated_keys", keys)
+
+    # Event log (buffered per tick)
     def _append_event(
         self,
         instance_id: str,
@@ -197,65 +400,78 @@ class Engine:
         actor: Optional[str],
         data: Dict[str, Any],
     ) -> None:
+        self._pending_events.append(Event(tick_iso(), instance_id, event, node, status, actor, data))
+
+    def _flush_events(self, instance_id: str) -> None:
+        pending, self._pending_events = self._pending_events, []
+        if not pending:
+            return
         events = self._unwrap(self.store.get(self.EVENTS_NS, instance_id)) or []
-        events.append({
-            "ts": now_iso(),
-            "instance_id": instance_id,
-            "event": event,
-            "node": node,
-            "status": status,
-            "actor": actor,
-            "data": data,
-        })
+        events.extend(pending)
         self.store.put(self.EVENTS_NS, instance_id, events)
 
     # Meta helpers
-    def _put_meta(self, m: InstanceMeta) -> None:
-        self.store.put(self.META_NS, m.instance_id, m.to_dict())
+    def _put_meta(self, m: Dict[str, Any]) -> None:
+        old = self._unwrap(self.store.get(self.META_NS, m["instance_id"]))
+        self.store.put(self.META_NS, m["instance_id"], m)
+        self._reindex_meta(old, m)
+        self._reorder_meta(m)
 
     def _get_meta(self, instance_id: str) -> Optional[InstanceMeta]:
         d = self._unwrap(self.store.get(self.META_NS, instance_id))
         return InstanceMeta.from_dict(d) if d else None
 
-    def _update_meta_from_state(self, instance_id: str, actor: str, s: Dict[str, Any]) -> InstanceMeta:
-        m = self._get_meta(instance_id)
-        if not m:
+    def _update_meta_from_state(
+        self, instance_id: str, actor: str, s: Dict[str, Any], pending_status: str
+    ) -> Dict[str, Any]:
+        # Works on the stored meta dict and persists once; terminal statuses win over pending_status
+        stored = self._unwrap(self.store.get(self.META_NS, instance_id))
+        if not stored:
             raise ValueError("Missing meta")
-        last_node = s.get("meta", {}).get("last_node")
-        status = s.get("meta", {}).get("status", m.status)
+        m = dict(stored)  # shallow copy keeps the old values for _reindex_meta
+        s_meta = s.get("meta", {})
+        last_node = s_meta.get("last_node")
+        status = s_meta.get("status", m["status"])
 
-        m.last_actor = actor
+        prev_node = m["last_node"]  # always the node of the latest step
+        m["last_actor"] = actor
         if last_node:
-            m.last_node = last_node
-        if s.get("meta", {}).get("start_time") and not m.start_time:
-            m.start_time = s["meta"]["start_time"]
-        if s.get("meta", {}).get("end_time"):
-            m.end_time = s["meta"]["end_time"]
-        m.status = status
-
-        # Step history on node change
-        prev_node = m.steps_history[-1]["node"] if m.steps_history else None
+            m["last_node"] = last_node
+        if s_meta.get("start_time") and not m["start_time"]:
+            m["start_time"] = s_meta["start_time"]
+        if s_meta.get("end_time"):
+            m["end_time"] = s_meta["end_time"]
+
+        # Step on node change. Only counted here: the tick's outcome event (paused,
+        # progressed, completed, aborted) already records it, see steps_history.
+        # Node names are interned constants, and str != tests identity before
+        # comparing characters, so a re-run of the same node costs one pointer compare.
         if last_node and last_node != prev_node:
-            m.steps_history.append({
-                "ts": now_iso(),
-                "node": last_node,
-                "actor": actor,
-                "status": m.status
-            })
+            m["last_step_seq"] += 1
+            m["last_step_ts"] = tick_iso()
 
+        m["status"] = status if status in _TERMINAL_STATUSES else pending_status
         self._put_meta(m)
         return m
 
     # ---- lifecycle ----
     def start(self, customer_id: str, started_by: str) -> Tuple[str, Dict[str, Any]]:
-        instance_id = str(uuid.uuid4())
+        # Interned: one shared object serves every store key, index set and event for this id
+        instance_id = sys.intern(str(uuid.uuid4()))
+        with _tick():
+            try:
+                return self._start(instance_id, customer_id, started_by)
+            finally:
+                self._flush_events(instance_id)
+
+    def _start(self, instance_id: str, customer_id: str, started_by: str) -> Tuple[str, Dict[str, Any]]:
         # Initial graph state
         state = {
             "instance_id": instance_id,
             "customer_id": customer_id,
             "workflow_name": self.workflow_name,
             "bag": {},
-            "meta": {"status": "in_progress", "start_time": now_iso()},
+            "meta": {"status": "in_progress", "start_time": tick_iso()},
         }
         # Audit meta
         meta = InstanceMeta(
@@ -270,14 +486,23 @@ class Engine:
 
         # Persist and index
         self.store.put(self.STATE_NS, instance_id, state)
-        self._put_meta(meta)
-        self._add_to_index(instance_id)
+        self._put_meta(meta.to_dict())
         self._append_event(instance_id, "created", None, meta.status, started_by, {"customer_id": customer_id})
 
         # First run
         return instance_id, self._run(instance_id, state, actor=started_by)
 
     def resume(self, instance_id: str, actor: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+        # Callers pass fresh strings (e.g. UI text input); interning makes key compares identity hits
+        if isinstance(instance_id, str):  # anything else fails the lookup with ValueError below
+            instance_id = sys.intern(instance_id)
+        with _tick():
+            try:
+                return self._resume(instance_id, actor, updates)
+            finally:
+                self._flush_events(instance_id)
+
+    def _resume(self, instance_id: str, actor: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         item = self.store.get(self.STATE_NS, instance_id)
         state = self._unwrap(item)
         if not state:
@@ -285,7 +510,11 @@ class Engine:
 
         # Apply HITL updates
         bag = state.setdefault("bag", {})
-        bag.update(updates)
+        # Decisions are normalized once here, so routers compare the stored value as-is
+        bag.update(
+            (k, norm(v) if k in _DECISION_KEYS else _intern_input(v))
+            for k, v in updates.items()
+        )
 
         # Persist before invoke and log
         self.store.put(self.STATE_NS, instance_id, state)
@@ -301,20 +530,27 @@ class Engine:
 
     # ---- run helpers ----
     def _run(self, instance_id: str, state: Dict[str, Any], actor: str) -> Dict[str, Any]:
-        result = self.graph.invoke(state)
+        # A resume that adds no routable input re-pauses where it was: skip the graph entirely
+        pattern = _pause_pattern(state.get("bag", {}))
+        template = self._pause_templates.get(pattern)
+        if template is not None:
+            last_node, prompt = template
+            state.setdefault("meta", {})["last_node"] = last_node
+            result = Interrupt(prompt)
+        else:
+            result = self.graph.invoke(state)
+            if isinstance(result, Interrupt):
+                self._pause_templates[pattern] = (state.get("meta", {}).get("last_node"), result.value)
 
         # Paused (Interrupt): persist and report
         if isinstance(result, Interrupt):
             self.store.put(self.STATE_NS, instance_id, state)
-            meta = self._update_meta_from_state(instance_id, actor, state)
-            if meta.status not in {"completed", "aborted"}:
-                meta.status = "paused"
-                self._put_meta(meta)
+            meta = self._update_meta_from_state(instance_id, actor, state, pending_status="paused")
             self._append_event(
                 instance_id,
                 "paused",
                 state.get("meta", {}).get("last_node"),
-                meta.status,
+                meta["status"],
                 actor,
                 {"prompt": result.value},
             )
@@ -326,42 +562,23 @@ class Engine:
 
         # Persist and audit
         self.store.put(self.STATE_NS, instance_id, result)
-        meta = self._update_meta_from_state(instance_id, actor, result)
+        meta = self._update_meta_from_state(instance_id, actor, result, pending_status="in_progress")
         node = result.get("meta", {}).get("last_node")
-        status = result.get("meta", {}).get("status", meta.status)
+        status = meta["status"]
 
-        if status == "completed":
-            meta.status = "completed"
-            self._put_meta(meta)
-            self._append_event(
-                instance_id, "completed", node, meta.status, actor,
-                {"result": result.get("bag", {}).get("result")}
-            )
+        # Completed or aborted
+        if status in _TERMINAL_STATUSES:
+            outcome = result.get("bag", {}).get("result")
+            self._append_event(instance_id, status, node, status, actor, {"result": outcome})
             return {
-                "status": "completed",
+                "status": status,
                 "node": node,
-                "result": result.get("bag", {}).get("result"),
-                "instance_id": instance_id,
-            }
-
-        if status == "aborted":
-            meta.status = "aborted"
-            self._put_meta(meta)
-            self._append_event(
-                instance_id, "aborted", node, meta.status, actor,
-                {"result": result.get("bag", {}).get("result")}
-            )
-            return {
-                "status": "aborted",
-                "node": node,
-                "result": result.get("bag", {}).get("result"),
+                "result": outcome,
                 "instance_id": instance_id,
             }
 
         # Progressed without pausing
-        meta.status = "in_progress"
-        self._put_meta(meta)
-        self._append_event(instance_id, "progressed", node, meta.status, actor, {})
+        self._append_event(instance_id, "progressed", node, status, actor, {})
         return {"status": "in_progress", "node": node, "instance_id": instance_id}
 
     # ---- queries ----
@@ -372,7 +589,19 @@ class Engine:
         return self._get_meta(instance_id)
 
     def history(self, instance_id: str) -> List[Dict[str, Any]]:
-        return self._unwrap(self.store.get(self.EVENTS_NS, instance_id)) or []
+        events = self._unwrap(self.store.get(self.EVENTS_NS, instance_id)) or []
+        return [e.to_dict() for e in events]
+
+    def steps_history(self, instance_id: str) -> List[Dict[str, Any]]:
+        # [{ts, node, actor, status}], one entry per node change among the tick outcome events
+        events = self._unwrap(self.store.get(self.EVENTS_NS, instance_id)) or []
+        steps: List[Dict[str, Any]] = []
+        prev_node = None
+        for e in events:
+            if e.event in _STEP_EVENTS and e.node and e.node != prev_node:
+                steps.append({"ts": e.ts, "node": e.node, "actor": e.actor, "status": e.status})
+                prev_node = e.node
+        return steps
 
     def list_instances(
         self,
@@ -380,24 +609,53 @@ class Engine:
         status: Optional[str] = None,
         started_by: Optional[str] = None,
         workflow_name: Optional[str] = None,
-    ) -> List[InstanceMeta]:
-        ids = self._unwrap(self.store.get(self.INDEX_NS, "instances")) or []
-        out: List[InstanceMeta] = []
-        for iid in ids:
-            m = self._get_meta(iid)
-            if not m:
-                continue
-            if workflow_name and m.workflow_name != workflow_name:
-                continue
-            if customer_id and m.customer_id != customer_id:
-                continue
-            if status and m.status != status:
-                continue
-            if started_by and m.started_by != started_by:
+        limit: Optional[int] = None,
+    ) -> List[InstanceMetaView]:
+        if limit is not None and limit <= 0:
+            return []
+        filters = {
+            "workflow_name": workflow_name,
+            "customer_id": customer_id,
+            "status": status,
+            "started_by": started_by,
+        }
+        active = {f: v for f, v in filters.items() if v}
+        if not active:
+            # Walk the pre-sorted order newest-first and stop once limit is reached
+            order = self._unwrap(self.store.get(self.INDEX_NS, "by_updated")) or []
+            out: List[InstanceMetaView] = []
+            for _, _, iid in reversed(order):
+                d = self._unwrap(self.store.get(self.META_NS, iid))
+                if d:
+                    out.append(InstanceMetaView(d))
+                    if limit is not None and len(out) >= limit:
+                        break
+            return out
+
+        # Start from the smallest index set covering some of the filters
+        best: Optional[set] = None
+        covered: Tuple[str, ...] = ()
+        for name, columns in self.INDEXES.items():
+            if not all(c in active for c in columns):
                 continue
-            out.append(m)
-        out.sort(key=lambda x: (x.steps_history[-1]["ts"] if x.steps_history else ""), reverse=True)
-        return out
+            ids = self._get_index(name).get(self._index_key(active, columns))
+            if not ids:
+                return []
+            if best is None or len(ids) < len(best):
+                best, covered = ids, columns
+        residual = [(f, v) for f, v in active.items() if f not in covered]
+
+        # Check the remaining filters on the hits only, then order them by last step time
+        hits: List[Dict[str, Any]] = []
+        for iid in best:
+            d = self._unwrap(self.store.get(self.META_NS, iid))
+            if d and all(d.get(f) == v for f, v in residual):
+                hits.append(d)
+        keys = self._unwrap(self.store.get(self.INDEX_NS, "updated_keys")) or {}
+        hits.sort(key=lambda d: keys[d["instance_id"]], reverse=True)
+        if limit is not None:
+            hits = hits[:limit]
+        return [InstanceMetaView(d) for d in hits]
 
 # ==========
 # Demo
@@ -435,4 +693,8 @@ if __name__ == "__main__":
     for ev in engine.history(inst_id):
         print("  ", ev)
 
+    print("\nSteps:")
+    for step in engine.steps_history(inst_id):
+        print("  ", step)
+
     print("\nMeta:", engine.get_meta(inst_id))
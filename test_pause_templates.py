@@ -0,0 +1,60 @@
+"""Differential check for Engine's pause-template cache.
+
+A resume answered from the cache must look exactly like one that ran the graph:
+same result, same meta, same event sequence. Runs under pytest or directly.
+"""
+import importlib.util
+import os
+import random
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location("langgraph_wf_claim", os.path.join(_HERE, "langgraph-wf-claim.py"))
+wf = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = wf
+_spec.loader.exec_module(wf)
+
+# Valid, invalid, mixed-case, unhashable and empty inputs for every HITL key
+UPDATES = [
+    {},
+    {"validate": "yes"}, {"validate": "No"}, {"validate": "maybe"}, {"validate": ["yes"]},
+    {"claim_details": ""}, {"claim_details": "Claim for disputed withdrawal"},
+    {"process_decision": "cancel"}, {"process_decision": "HOLD"}, {"process_decision": " suppress "},
+    {"process_decision": {"x": 1}},
+    {"hold_action": "resume"}, {"hold_action": "Abort"}, {"hold_action": "later"},
+    {"proceed_fulfill": "yes"}, {"proceed_fulfill": "no"}, {"proceed_fulfill": "?"},
+]
+
+def _audit(engine, instance_id):
+    meta = engine.get_meta(instance_id).to_dict()
+    for k in ("instance_id", "start_time", "end_time", "last_step_ts"):
+        meta.pop(k)
+    events = [(e["event"], e["node"], e["status"], e["actor"]) for e in engine.history(instance_id)]
+    return meta, engine.get_state(instance_id)["bag"], events
+
+def test_cached_resumes_match_uncached(ticks: int = 400, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    cached = wf.Engine(wf.InMemoryStore())
+    uncached = wf.Engine(wf.InMemoryStore())
+    done = 0
+    while done < ticks:
+        a, out_a = cached.start("C1", "starter")
+        b, out_b = uncached.start("C1", "starter")
+        out_a.pop("instance_id")
+        out_b.pop("instance_id")
+        assert out_a == out_b
+        # Keep resuming a few ticks past terminal status too
+        for _ in range(rng.randint(1, 10)):
+            updates = rng.choice(UPDATES)
+            uncached._pause_templates.clear()
+            res_a = cached.resume(a, "actor", dict(updates))
+            res_b = uncached.resume(b, "actor", dict(updates))
+            res_a.pop("instance_id")
+            res_b.pop("instance_id")
+            assert res_a == res_b, (updates, res_a, res_b)
+            assert _audit(cached, a) == _audit(uncached, b), updates
+            done += 1
+
+if __name__ == "__main__":
+    test_cached_resumes_match_uncached()
+    print("ok")
@@ -1,3 +1,4 @@
+import functools
 import streamlit as st
 import json
 from streamlit_mermaid import st_mermaid
@@ -7,35 +8,50 @@ from typing import Optional
 import json
 from typing import Optional, Dict, Any, List
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Tuple
 import streamlit as st
 from streamlit_mermaid import st_mermaid
-from test import Engine, InMemoryStore, InstanceMeta
+from test import Engine, InMemoryStore, InstanceMetaView
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is the fallback
+    orjson = None
+
+# For payloads that grow with the workflow (step records); small results keep st.json
+def json_dumps(o: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(o, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(o, indent=2)
+
+def json_loads(s: str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either way
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
 
 # Mermaid diagram generator
-def workflow_mermaid(meta: Dict[str, Any]) -> str:
-    node_ids = {
-        "Validate Request": "A",
-        "Gather Claim Info": "B",
-        "Identify Accounts & Process Decision": "D",
-        "Cancel CWD Request": "C",
-        "Hold Request": "E",
-        "Apply Temporary Suppression": "F",
-        "Fulfill Case and Detect": "G",
-        "END": "H",
-    }
+_NODE_IDS = {
+    "Validate Request": "A",
+    "Gather Claim Info": "B",
+    "Identify Accounts & Process Decision": "D",
+    "Cancel CWD Request": "C",
+    "Hold Request": "E",
+    "Apply Temporary Suppression": "F",
+    "Fulfill Case and Detect": "G",
+    "END": "H",
+}
 
+# Pure in (current node, visited path), so identical workflows share one rendered string
+@functools.lru_cache(maxsize=512)
+def _mermaid_for(current_node: str, visited: Tuple[str, ...]) -> str:
     visited_styles = []
-    for step in meta.get("steps_history", []):
-        node = step.get("node")
-        if node in node_ids:
-            visited_styles.append(f"style {node_ids[node]} fill:#e3f2fd,stroke:#1565c0,stroke-width:2px;")
+    for node in visited:
+        if node in _NODE_IDS:
+            visited_styles.append(f"style {_NODE_IDS[node]} fill:#e3f2fd,stroke:#1565c0,stroke-width:2px;")
 
-    current_node = meta.get("last_node") or (
-        meta["steps_history"][-1]["node"] if meta.get("steps_history") else "Validate Request"
-    )
-    if current_node in node_ids:
-        visited_styles.append(f"style {node_ids[current_node]} fill:#ffecb3,stroke:#ff6f00,stroke-width:4px;")
+    if current_node in _NODE_IDS:
+        visited_styles.append(f"style {_NODE_IDS[current_node]} fill:#ffecb3,stroke:#ff6f00,stroke-width:4px;")
 
     styles = "\n    ".join(visited_styles)
     return f"""
@@ -55,6 +71,11 @@ graph TD
     {styles}
 """
 
+def workflow_mermaid(meta: Mapping[str, Any], steps: List[Dict[str, Any]]) -> str:
+    visited = tuple(step.get("node") for step in steps)
+    current_node = meta.get("last_node") or (visited[-1] if visited else "Validate Request")
+    return _mermaid_for(current_node, visited)
+
 # Init engine
 if "engine" not in st.session_state:
     st.session_state.store = InMemoryStore()
@@ -88,7 +109,7 @@ with st.form("resume_form"):
     resume_btn = st.form_submit_button("Resume Workflow")
     if resume_btn:
         try:
-            updates = json.loads(updates_str or "{}")
+            updates = json_loads(updates_str or "{}")
             out = engine.resume(resume_id, actor, updates)
             st.success(f"Workflow {resume_id} resumed by {actor}")
             st.json(out)
@@ -97,31 +118,31 @@ with st.form("resume_form"):
 
 # All workflows
 st.header("📋 All Workflows")
-instances: List[InstanceMeta] = engine.list_instances()
+instances: List[InstanceMetaView] = engine.list_instances()
 if instances:
     for m in instances:
-        meta = m.to_dict()
-        if not meta.get("last_node"):
-            meta["last_node"] = "Validate Request"
+        meta = m.as_mapping()  # read-only view of the stored meta, no copy
+        last_node = meta.get("last_node") or "Validate Request"
         with st.expander(f"Workflow {meta['instance_id']} — {meta['status']}"):
             st.write("**Customer ID:**", meta["customer_id"])
             st.write("**Workflow Name:**", meta["workflow_name"])
             st.write("**Started By:**", meta["started_by"])
             st.write("**Last Actor:**", meta["last_actor"])
-            st.write("**Last Node:**", meta["last_node"])
+            st.write("**Last Node:**", last_node)
             st.write("**Start Time:**", meta["start_time"])
             st.write("**End Time:**", meta["end_time"])
             st.write("**Status:**", meta["status"])
 
             st.markdown("**Steps History:**")
-            if meta["steps_history"]:
-                for i, step in enumerate(meta["steps_history"], start=1):
+            steps = engine.steps_history(meta["instance_id"])
+            if steps:
+                for i, step in enumerate(steps, start=1):
                     st.markdown(f"**Step {i}:**")
-                    st.json(step)
+                    st.code(json_dumps(step), language="json")
             else:
                 st.write("_No steps recorded yet_")
 
             st.markdown("**Workflow Diagram:**")
-            st_mermaid(workflow_mermaid(meta))
+            st_mermaid(workflow_mermaid(meta, steps))
 else:
     st.info("No workflows yet.")